@@ -12,19 +12,37 @@ import sys
 import os
 import shutil
 import json
+import hashlib
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+try:
+    from PIL import Image # Optional: faster thumbnail decoding (see ThumbnailTask)
+except ImportError:
+    Image = None
+try:
+    import orjson # Optional: faster log serialization (see serialize_log)
+except ImportError:
+    orjson = None
+try:
+    import psutil # Optional: sizes the in-memory thumbnail cache to the machine (see memory_cache_limit)
+except ImportError:
+    psutil = None
+PIL_LANCZOS = getattr(Image, "Resampling", Image).LANCZOS if Image is not None else None
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QScrollArea, QGridLayout, # Keep QGridLayout
-    QSplitter, QTextEdit, QFrame, QSizePolicy, QSpacerItem,
-    QListWidget, QListWidgetItem, QAbstractItemView, QProgressBar # Keep QListWidget/Item
+    QSplitter, QTextEdit, QFrame, QSizePolicy,
+    QListView, QStyledItemDelegate, QStyle, QAbstractItemView, QProgressBar
 )
 from PySide6.QtGui import (
     QPixmap, QPixmapCache, QAction, QKeySequence, QPalette, QColor,
-    QTextCursor, QIcon, QPainter, QPen
+    QTextCursor, QIcon, QPainter, QPen, QBrush, QImage, QImageReader
 )
 from PySide6.QtCore import (
-    Qt, QSize, QTimer, Slot, QStandardPaths
+    Qt, QSize, QRect, QPoint, QTimer, Slot, Signal, QStandardPaths, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex
 )
 
 # Constants
@@ -35,182 +53,557 @@ THUMBNAIL_SIZES = {
     "xlarge": 400
 }
 DEFAULT_THUMBNAIL_SIZE = "medium"
+SUPPORTED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff'})
 LOG_SAVE_INTERVAL = 2000
+LOG_MIN_WRITE_INTERVAL = 1000 # Minimum time between log file writes requested by actions (ms)
+LOG_FLUSH_INTERVAL = 100 # Log console refresh period (ms)
 MAX_LOG_LINES = 1000
 PATH_AREA_WIDTH = 350
 ROW_VERTICAL_PADDING = 10
-# Custom data role for storing image path in QListWidgetItem
+ROW_HORIZONTAL_MARGIN = 5
+ROW_SPACING = 10
+# Offset of the thumbnail area from the left edge of a row (margin + file name + spacing)
+THUMBNAIL_AREA_OFFSET = ROW_HORIZONTAL_MARGIN + PATH_AREA_WIDTH + ROW_SPACING
+# Rows above/below the viewport whose thumbnails are decoded ahead of scrolling
+THUMBNAIL_PREFETCH_ROWS = 10
+# Idle time after the last zoom step before fast previews are replaced by smooth thumbnails
+RESMOOTH_DELAY_MS = 250
+# In-memory (QPixmapCache) thumbnail budget in bytes; thumbnails of every zoom level share it
+MEMORY_CACHE_LIMIT = 200 * 1024 * 1024
+LARGE_MEMORY_CACHE_LIMIT = 512 * 1024 * 1024 # Used on machines with more than 8 GB of RAM
+# Worker threads used to move files concurrently in apply_changes
+MOVE_WORKERS = 8
+# Moves handed to a worker at once: one task per batch instead of one per file
+MOVE_BATCH_SIZE = 64
+# Size limit of the persistent thumbnail cache, enforced (oldest first) at startup
+DISK_CACHE_LIMIT = 500 * 1024 * 1024
+# Temp files younger than this may still be written by a ThumbnailTask; pruning leaves them alone (s)
+DISK_CACHE_TMP_GRACE = 3600
+# Custom data roles exposed by ImageListModel
 ImagePathRole = Qt.ItemDataRole.UserRole + 1
+ImageLabelRole = Qt.ItemDataRole.UserRole + 2
 
-# --- ImageLabelWidget (No changes needed) ---
-class ImageLabelWidget(QWidget):
-    """Widget to display an image thumbnail with a fixed size based on scaled pixmap."""
-    def __init__(self, image_path, thumbnail_size_bound, parent_row):
-        super().__init__(parent_row)
-        self.image_path = image_path
-        self.thumbnail_size_bound = thumbnail_size_bound # Store the bound
-        self.parent_row = parent_row
-        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.layout.addWidget(self.image_label)
-        self.set_thumbnail()
-
-    def set_thumbnail(self):
-        cache_key = f"{self.image_path}_{self.thumbnail_size_bound}"
-        pixmap = QPixmapCache.find(cache_key)
-        scaled_size = QSize(self.thumbnail_size_bound, self.thumbnail_size_bound)
-
-        if not pixmap:
-            original_pixmap = QPixmap(self.image_path)
-            if not original_pixmap.isNull():
-                pixmap = original_pixmap.scaled(scaled_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                if not pixmap.isNull(): # Check if scaling was successful
-                    QPixmapCache.insert(cache_key, pixmap)
-                else:
-                     print(f"Warning: Failed to scale pixmap for {os.path.basename(self.image_path)}")
-                     pixmap = None # Indicate failure to trigger error display
-            else:
-                print(f"Warning: Failed to load pixmap for {os.path.basename(self.image_path)}")
-                pixmap = None # Indicate failure
-
-        if pixmap and not pixmap.isNull():
-            actual_pixmap_size = pixmap.size()
-            self.image_label.setPixmap(pixmap)
-            self.image_label.setFixedSize(actual_pixmap_size)
-            self.setFixedSize(actual_pixmap_size)
-        else:
-             # Final fallback / error display
-             error_size = QSize(self.thumbnail_size_bound // 2, self.thumbnail_size_bound // 2)
-             pixmap = QPixmap(error_size)
-             pixmap.fill(Qt.GlobalColor.lightGray)
-             try:
-                 painter = QPainter(pixmap)
-                 pen = QPen(Qt.GlobalColor.red)
-                 painter.setPen(pen)
-                 painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "Load\nError")
-                 painter.end()
-             except Exception as paint_error:
-                 print(f"Error drawing placeholder text: {paint_error}")
-
-             self.image_label.setPixmap(pixmap)
-             self.image_label.setFixedSize(error_size)
-             self.setFixedSize(error_size)
+def memory_cache_limit():
+    """Returns the QPixmapCache limit in bytes; larger when psutil reports plenty of RAM."""
+    if psutil is not None:
+        try:
+            if psutil.virtual_memory().total > 8 * 1024 ** 3:
+                return LARGE_MEMORY_CACHE_LIMIT
+        except Exception:
+            pass
+    return MEMORY_CACHE_LIMIT
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            # Tell the parent row (ImageRowWidget) about the click
-            self.parent_row.handle_thumbnail_click()
-        super().mousePressEvent(event)
-
-    def update_thumbnail_size(self, new_size_bound):
-        """Updates the target bounding size and regenerates the thumbnail."""
-        if self.thumbnail_size_bound != new_size_bound:
-            old_cache_key = f"{self.image_path}_{self.thumbnail_size_bound}"
-            QPixmapCache.remove(old_cache_key)
-            self.thumbnail_size_bound = new_size_bound
-            self.set_thumbnail()
-
-
-# --- ImageRowWidget (Adjusted for QListWidget context) ---
-class ImageRowWidget(QWidget):
-    """Represents the visual content of a single row within a QListWidgetItem."""
-    def __init__(self, image_path, initial_label, thumbnail_size_bound, main_window, list_item, parent=None):
-        super().__init__(parent)
-        self.setObjectName("ImageRowWidget") # For styling if needed
+
+# --- Persistent Thumbnail Cache ---
+def disk_cache_key(image_path, thumbnail_size_bound):
+    """Returns the disk cache key of a thumbnail; editing the file changes its mtime and thus the key."""
+    mtime_ns = os.stat(image_path).st_mtime_ns
+    return hashlib.sha1(f"{image_path}|{mtime_ns}|{thumbnail_size_bound}".encode("utf-8")).hexdigest()
+
+
+def disk_cache_path(cache_dir, key):
+    """Returns the PNG file holding a cached thumbnail (sharded by the first two key characters)."""
+    return os.path.join(cache_dir, key[:2], key + ".png")
+
+
+def prune_disk_cache(cache_dir, max_bytes):
+    """Deletes the least recently used thumbnails until the cache is below max_bytes."""
+    entries = []
+    total_bytes = 0
+    tmp_cutoff = time.time() - DISK_CACHE_TMP_GRACE
+    for dir_path, _dir_names, file_names in os.walk(cache_dir):
+        for file_name in file_names:
+            file_path = os.path.join(dir_path, file_name)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            if file_name.endswith(".tmp") and st.st_mtime > tmp_cutoff:
+                continue # Possibly still being written; stale leftovers are pruned like thumbnails
+            entries.append((st.st_mtime, st.st_size, file_path))
+            total_bytes += st.st_size
+    if total_bytes <= max_bytes:
+        return
+    entries.sort() # Oldest use first; cache hits refresh the mtime
+    for _mtime, size, file_path in entries:
+        try:
+            os.remove(file_path)
+            total_bytes -= size
+        except OSError:
+            pass
+        if total_bytes <= max_bytes:
+            break
+
+
+# --- Background Thumbnail Decoding ---
+class ThumbnailSignals(QObject):
+    """Carries decoded thumbnails from worker threads back to the GUI thread."""
+    # (image_path, thumbnail_size_bound, scaled image - null on failure)
+    finished = Signal(str, int, QImage)
+
+
+class ThumbnailTask(QRunnable):
+    """Decodes and scales one image off the GUI thread.
+
+    Only QImage is used here: unlike QPixmap it is safe to create outside the
+    GUI thread. The QPixmap conversion happens in the receiving slot.
+    `pending` is the GUI's set of still wanted (path, bound) pairs; tasks whose
+    row scrolled out of range before they started are skipped.
+    Thumbnails are read from / written to the on-disk cache when cache_dir is set.
+    """
+    def __init__(self, image_path, thumbnail_size_bound, signals, pending, cache_dir=None):
+        super().__init__()
         self.image_path = image_path
-        self.current_label = initial_label
         self.thumbnail_size_bound = thumbnail_size_bound
+        self.signals = signals
+        self.pending = pending
+        self.cache_dir = cache_dir
+
+    def run(self):
+        if (self.image_path, self.thumbnail_size_bound) not in self.pending:
+            return # No longer wanted
+
+        cache_path = None
+        if self.cache_dir:
+            try:
+                cache_path = disk_cache_path(self.cache_dir, disk_cache_key(self.image_path, self.thumbnail_size_bound))
+            except OSError:
+                pass # Source vanished; decoding below reports the error
+        if cache_path and os.path.exists(cache_path):
+            image = QImage(cache_path)
+            if not image.isNull():
+                try: os.utime(cache_path) # Mark as recently used for prune_disk_cache
+                except OSError: pass
+                self.signals.finished.emit(self.image_path, self.thumbnail_size_bound, image)
+                return
+
+        image = self._decode_with_pillow() if Image is not None else None
+        if image is None or image.isNull():
+            image = self._decode_with_qt()
+        if not image.isNull():
+            # Fit to the bound; also upscales images smaller than the thumbnail size
+            if max(image.width(), image.height()) != self.thumbnail_size_bound:
+                image = image.scaled(self.thumbnail_size_bound, self.thumbnail_size_bound,
+                                     Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            if cache_path:
+                self._write_cache(image, cache_path)
+        self.signals.finished.emit(self.image_path, self.thumbnail_size_bound, image)
+
+    def _decode_with_pillow(self):
+        """Decodes and downsizes the image with Pillow's C resampling; None if Pillow can't read it.
+
+        For JPEGs, draft() lets libjpeg decode directly at a reduced scale,
+        skipping most of the full-resolution pixels.
+        """
+        bound = self.thumbnail_size_bound
+        try:
+            with Image.open(self.image_path) as im:
+                if im.mode.startswith(("I", "F")):
+                    return None # 16/32-bit and float images: convert() clips them, Qt rescales them properly
+                im.draft("RGB", (bound, bound))
+                if im.mode not in ("RGB", "RGBA"):
+                    has_alpha = im.mode in ("LA", "PA") or "transparency" in im.info
+                    im = im.convert("RGBA" if has_alpha else "RGB")
+                im.thumbnail((bound, bound), PIL_LANCZOS)
+                fmt = QImage.Format.Format_RGBA8888 if im.mode == "RGBA" else QImage.Format.Format_RGB888
+                data = im.tobytes("raw", im.mode)
+                # copy() detaches the QImage from the Python bytes buffer
+                return QImage(data, im.width, im.height, im.width * len(im.mode), fmt).copy()
+        except Exception:
+            return None # Let Qt try; it reports the failure if it can't decode either
+
+    def _decode_with_qt(self):
+        """Decodes the image with QImageReader, shrinking it while decoding where possible.
+
+        With a scaled size set, the JPEG plugin uses libjpeg's DCT scaling
+        instead of decoding every full-resolution pixel.
+        """
+        reader = QImageReader(self.image_path)
+        size = reader.size()
+        if size.isValid() and max(size.width(), size.height()) > self.thumbnail_size_bound:
+            size.scale(self.thumbnail_size_bound, self.thumbnail_size_bound, Qt.AspectRatioMode.KeepAspectRatio)
+            reader.setScaledSize(size)
+        return reader.read() # Null QImage if it can't be decoded
+
+    def _write_cache(self, image, cache_path):
+        """Stores a thumbnail in the disk cache; readers never see a partial file."""
+        tmp_path = f"{cache_path}.{id(self)}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            if image.save(tmp_path, "PNG", 80): # Quality 80 = zlib level 1: fast to write, still compressed
+                os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Failed to write thumbnail cache {cache_path}: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                try: os.remove(tmp_path)
+                except OSError: pass
+
+
+# --- Background Log Writing ---
+def serialize_log(entries):
+    """Encodes log entries as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+    return json.dumps(entries, indent=2).encode("utf-8")
+
+
+class LogWriteSignals(QObject):
+    """Reports log write failures back to the GUI thread."""
+    # (log_file_path, error message)
+    failed = Signal(str, str)
+
+
+class LogWriteTask(QRunnable):
+    """Writes the serialized log file off the GUI thread.
+
+    The data goes to a temporary file that then replaces the log in one
+    step, so a crash or slow disk never leaves a truncated log behind.
+    """
+    def __init__(self, log_file_path, data, signals):
+        super().__init__()
+        self.log_file_path = log_file_path
+        self.data = data
+        self.signals = signals
+
+    def run(self):
+        tmp_path = self.log_file_path + ".tmp"
+        tmp_written = False
+        try:
+            with open(tmp_path, 'wb') as f:
+                tmp_written = True
+                f.write(self.data)
+            os.replace(tmp_path, self.log_file_path)
+        except OSError as e:
+            if tmp_written: # Don't leave our partial/unreplaced temp file behind
+                try: os.remove(tmp_path)
+                except OSError: pass
+            self.signals.failed.emit(self.log_file_path, str(e))
+
+
+# --- File Moves ---
+def move_file(source_path, destination_path):
+    """Moves a file, using a single rename when source and destination share a filesystem.
+
+    Falls back to shutil.move (copy + delete) only when the rename is refused,
+    e.g. across devices. A missing source raises FileNotFoundError.
+    """
+    try:
+        os.replace(source_path, destination_path)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.move(source_path, destination_path)
+
+
+def move_files(moves):
+    """Runs move_file for a batch of (source_path, destination_path) pairs.
+
+    Returns one entry per pair: None on success, otherwise the raised exception.
+    """
+    errors = []
+    for source_path, destination_path in moves:
+        try:
+            move_file(source_path, destination_path)
+            errors.append(None)
+        except Exception as e:
+            errors.append(e)
+    return errors
+
+
+def move_files_ordered(moves):
+    """Runs (source_path, destination_path) pairs whose destinations are other pairs' sources, e.g. swaps.
+
+    Every source is first renamed aside within its own directory, then moved on in list
+    order, so the result does not depend on timing. A destination that still exists is
+    never overwritten: that file is put back and FileExistsError is reported for it.
+    Returns one entry per pair, like move_files.
+    """
+    errors = [None] * len(moves)
+    parked = [] # (index, temporary path)
+    for index, (source_path, _destination_path) in enumerate(moves):
+        temp_path = f"{source_path}.{os.getpid()}.moving"
+        try:
+            os.replace(source_path, temp_path)
+            parked.append((index, temp_path))
+        except Exception as e:
+            errors[index] = e
+    for index, temp_path in parked:
+        source_path, destination_path = moves[index]
+        try:
+            if os.path.lexists(destination_path):
+                raise FileExistsError(f"'{destination_path}' already exists")
+            move_file(temp_path, destination_path)
+        except Exception as e:
+            errors[index] = e
+            try: os.replace(temp_path, source_path)
+            except OSError: pass
+    return errors
+
+
+# --- ImageListModel ---
+class ImageListModel(QAbstractListModel):
+    """Lightweight list model holding one image record per row.
+
+    Each row is the same dict stored in MainWindow.image_data:
+    {'path': str, 'basename': str, 'initial_label': str, 'current_label': str}
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._row_by_path = {} # {path: row} for O(1) lookups
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        img_info = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return img_info['basename']
+        if role in (ImagePathRole, Qt.ItemDataRole.ToolTipRole):
+            return img_info['path']
+        if role == ImageLabelRole:
+            return img_info['current_label']
+        return None
+
+    def clear(self):
+        """Removes all rows."""
+        self.beginResetModel()
+        self._rows = []
+        self._row_by_path = {}
+        self.endResetModel()
+
+    def append_rows(self, records):
+        """Appends image records as new rows with a single insert notification."""
+        if not records: return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._rows.extend(records)
+        for row, img_info in enumerate(records, first):
+            self._row_by_path[img_info['path']] = row
+        self.endInsertRows()
+
+    def row_info(self, row):
+        """Returns the image record stored at the given row."""
+        return self._rows[row]
+
+    def find_row(self, path):
+        """Returns the row holding the given image path, or -1 if it is not loaded."""
+        return self._row_by_path.get(path, -1)
+
+    def set_row_paths(self, renames):
+        """Changes the paths of loaded records (e.g. after their files were moved); renames is {old_path: new_path}.
+
+        All old paths are unindexed before any new one is added, so a new path may be
+        another renamed row's old path (a swap). Views are not notified; returns the
+        changed rows for notify_rows_changed.
+        """
+        rows = [(self._row_by_path.pop(old_path), new_path)
+                for old_path, new_path in renames.items() if old_path in self._row_by_path]
+        for row, new_path in rows:
+            self._rows[row]['path'] = new_path
+            self._row_by_path[new_path] = row
+        return [row for row, _new_path in rows]
+
+    def notify_row_changed(self, row):
+        """Tells attached views that the record at the given row was modified."""
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    def notify_rows_changed(self, rows):
+        """Tells attached views that the records at the given rows were modified.
+
+        Emits one dataChanged per run of consecutive rows, so unchanged rows in
+        between are not reported (and repainted) along with them.
+        """
+        run_start = run_end = None
+        for row in sorted(rows):
+            if run_end is not None and row == run_end + 1:
+                run_end = row
+                continue
+            if run_end is not None:
+                self.dataChanged.emit(self.index(run_start), self.index(run_end))
+            run_start = run_end = row
+        if run_end is not None:
+            self.dataChanged.emit(self.index(run_start), self.index(run_end))
+
+    def relayout(self):
+        """Tells attached views that row sizes changed (e.g. a new thumbnail size); rows stay in place."""
+        self.layoutAboutToBeChanged.emit()
+        self.layoutChanged.emit()
+
+
+# --- ImageDelegate ---
+class ImageDelegate(QStyledItemDelegate):
+    """Paints an image row (file name + thumbnail) directly, without per-row widgets.
+
+    The thumbnail is centered in the free area for 'center' images and placed
+    right after the file name for 'not_center' images.
+    """
+    def __init__(self, main_window, thumbnail_size_bound, parent=None):
+        super().__init__(parent)
         self.main_window = main_window
-        self.list_item = list_item # Keep reference to the list item
-        self.selected = False # Internal state for styling
-        # Let QListWidget manage the overall size policy
-
-        self.row_layout = QHBoxLayout(self)
-        self.row_layout.setContentsMargins(5, 2, 5, 2)
-        self.row_layout.setSpacing(10)
-
-        # Path Label
-        self.path_label = QLabel(os.path.basename(image_path))
-        self.path_label.setToolTip(image_path)
-        self.path_label.setFixedWidth(PATH_AREA_WIDTH)
-        self.path_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        self.path_label.setWordWrap(True)
-        self.row_layout.addWidget(self.path_label, 0)
-
-        # Spacers and Thumbnail
-        self.left_spacer = QSpacerItem(10, 10, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        self.row_layout.addSpacerItem(self.left_spacer)
-        self.thumbnail_widget = ImageLabelWidget(image_path, thumbnail_size_bound, self)
-        self.row_layout.addWidget(self.thumbnail_widget, 0, Qt.AlignmentFlag.AlignCenter)
-        self.right_spacer = QSpacerItem(10, 10, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        self.row_layout.addSpacerItem(self.right_spacer)
-
-        self.update_thumbnail_position()
-        self._adjust_widget_height() # Adjust initial height based on content
-
-    def _adjust_widget_height(self):
-        """Adjusts the height hint for this widget based on content."""
-        thumb_height = self.thumbnail_widget.height()
-        path_height = self.path_label.sizeHint().height()
-        # Use dynamic padding like before
-        dynamic_padding = max(ROW_VERTICAL_PADDING, int(self.thumbnail_widget.thumbnail_size_bound * 0.30))
-        target_height = max(thumb_height + dynamic_padding, path_height + dynamic_padding)
-        # Set fixed height for THIS widget, QListWidgetItem will use its sizeHint
-        self.setFixedHeight(target_height)
-        # Crucially, update the list item's size hint
-        if self.list_item:
-            self.list_item.setSizeHint(self.sizeHint()) # Use sizeHint which respects fixed height
-
-    def update_thumbnail_position(self):
-        """Sets stretch factors for alignment."""
-        if self.current_label == 'center':
-            self.row_layout.setStretch(1, 1)
-            self.row_layout.setStretch(3, 1)
-        else: # 'not_center'
-            self.row_layout.setStretch(1, 0)
-            self.row_layout.setStretch(3, 1)
-        self.row_layout.setStretch(2, 0) # Thumbnail never stretches
-        self.row_layout.activate()
-
-    def set_label(self, new_label):
-        """Updates the internal label and repositions the thumbnail."""
-        if self.current_label != new_label:
-            self.current_label = new_label
-            self.update_thumbnail_position()
-
-    def handle_thumbnail_click(self):
-        """Handles clicks on the thumbnail, tells MainWindow to toggle."""
-        self.main_window.handle_row_interaction(self.list_item, toggle_label=True)
-
-    def set_selected_style(self, selected):
-         """Applies visual styling based on the selection state (called by MainWindow)."""
-         self.selected = selected
-         if self.selected:
-              # Use a simpler style that doesn't rely on objectName for QListWidget context
-              self.setStyleSheet("QWidget { border: 2px solid dodgerblue; background-color: #e0e8f0; }")
-         else:
-              self.setStyleSheet("QWidget { border: none; background-color: transparent; }")
-
-    def update_thumbnail_size(self, new_size_bound):
-        """Updates the thumbnail size and adjusts widget height."""
-        if self.thumbnail_size_bound != new_size_bound:
-            self.thumbnail_size_bound = new_size_bound
-            self.thumbnail_widget.update_thumbnail_size(new_size_bound)
-            self._adjust_widget_height() # Recalculate height and update list item hint
+        self.thumbnail_size_bound = thumbnail_size_bound
+        # Painting resources are created once and reused for every row and repaint
+        self.selected_brush = QBrush(QColor("#e0e8f0"))
+        self.selected_pen = QPen(QColor("dodgerblue"), 2)
+        self.error_pen = QPen(Qt.GlobalColor.red)
+        # {(width, height, failed, device pixel ratio): QPixmap}; one tile per zoom level instead of
+        # filling (and laying out "Load Error" text) for every row on every paint
+        self._placeholder_tiles = {}
+        # {(font key, file name): wrapped text height}; the text column width never changes, so
+        # names are measured once per font and zoom changes only redo the arithmetic below
+        self._text_heights = {}
+
+    def sizeHint(self, option, index):
+        bound = self.thumbnail_size_bound
+        name = index.model().row_info(index.row())['basename']
+        text_key = (option.font.key(), name) # A font change (e.g. system font or DPI) must re-measure
+        text_height = self._text_heights.get(text_key)
+        if text_height is None:
+            text_height = option.fontMetrics.boundingRect(
+                QRect(0, 0, PATH_AREA_WIDTH, 0), Qt.TextFlag.TextWordWrap, name
+            ).height()
+            self._text_heights[text_key] = text_height
+        dynamic_padding = max(ROW_VERTICAL_PADDING, int(bound * 0.30))
+        height = max(bound, text_height) + dynamic_padding
+        width = THUMBNAIL_AREA_OFFSET + bound + ROW_HORIZONTAL_MARGIN
+        return QSize(width, height)
+
+    def clear_text_heights(self):
+        """Forgets measured file name heights (e.g. when another folder is loaded)."""
+        self._text_heights = {}
+
+    def _placeholder_tile(self, size, failed, device_pixel_ratio):
+        """Returns the placeholder (or "Load Error") tile for the given size, rendered once and reused."""
+        key = (size.width(), size.height(), failed, device_pixel_ratio)
+        tile = self._placeholder_tiles.get(key)
+        if tile is None:
+            tile = QPixmap(size * device_pixel_ratio)
+            tile.setDevicePixelRatio(device_pixel_ratio)
+            tile.fill(Qt.GlobalColor.lightGray)
+            if failed:
+                tile_painter = QPainter(tile)
+                tile_painter.setPen(self.error_pen)
+                tile_painter.drawText(QRect(QPoint(0, 0), size), Qt.AlignmentFlag.AlignCenter, "Load\nError")
+                tile_painter.end()
+            self._placeholder_tiles[key] = tile
+        return tile
+
+    def _thumbnail_size(self, pixmap, path):
+        """Returns the on-screen size of a row's thumbnail, placeholder or error box."""
+        if pixmap:
+            return pixmap.size()
+        if path in self.main_window.failed_thumbnails:
+            return QSize(self.thumbnail_size_bound // 2, self.thumbnail_size_bound // 2)
+        return QSize(self.thumbnail_size_bound, self.thumbnail_size_bound)
+
+    def thumbnail_rect(self, row_rect, index):
+        """Returns where the thumbnail of the given row is painted inside row_rect."""
+        img_info = index.model().row_info(index.row())
+        pixmap = self.main_window.cached_thumbnail(img_info['path'], self.thumbnail_size_bound)
+        return self._layout_thumbnail(row_rect, self._thumbnail_size(pixmap, img_info['path']), img_info['current_label'])
+
+    def _layout_thumbnail(self, row_rect, thumb_size, label):
+        """Positions the thumbnail: a single branch on the label, no layout pass involved."""
+        x = row_rect.left() + THUMBNAIL_AREA_OFFSET # 'not_center': right after the file name
+        if label == 'center':
+            area_width = row_rect.width() - THUMBNAIL_AREA_OFFSET - ROW_HORIZONTAL_MARGIN
+            x += max(0, (area_width - thumb_size.width()) // 2)
+        y = row_rect.top() + (row_rect.height() - thumb_size.height()) // 2
+        return QRect(x, y, thumb_size.width(), thumb_size.height())
+
+    def paint(self, painter, option, index):
+        # Read the record once instead of going through data() for every role
+        img_info = index.model().row_info(index.row())
+        path = img_info['path']
+        row_rect = option.rect
+        painter.save()
+
+        # Selection highlight
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(row_rect, self.selected_brush)
+            painter.setPen(self.selected_pen)
+            painter.drawRect(row_rect.adjusted(1, 1, -1, -1))
+
+        # File name
+        path_rect = QRect(row_rect.left() + ROW_HORIZONTAL_MARGIN, row_rect.top(), PATH_AREA_WIDTH, row_rect.height())
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.drawText(path_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter | Qt.TextFlag.TextWordWrap,
+                         img_info['basename'])
+
+        # Thumbnail, or a placeholder while it is being decoded / if it failed to load
+        pixmap = self.main_window.cached_thumbnail(path, self.thumbnail_size_bound)
+        thumb_rect = self._layout_thumbnail(row_rect, self._thumbnail_size(pixmap, path), img_info['current_label'])
+        if pixmap:
+            painter.drawPixmap(thumb_rect, pixmap)
+        else:
+            failed = path in self.main_window.failed_thumbnails
+            painter.drawPixmap(thumb_rect.topLeft(),
+                               self._placeholder_tile(thumb_rect.size(), failed, painter.device().devicePixelRatioF()))
+
+        painter.restore()
+
+
+# --- ImageListView ---
+class ImageListView(QListView):
+    """QListView that reports clicks on the thumbnail of the already selected row."""
+    thumbnail_clicked = Signal(QModelIndex)
+    viewport_resized = Signal()
+
+    def visible_rows(self):
+        """Returns the (first, last) rows intersecting the viewport, or None if no row is shown."""
+        self.executeDelayedItemsLayout() # Item geometry must be current
+        rect = self.viewport().rect()
+        x = rect.center().x()
+        gap = 2 * self.spacing() + 1 # A probe may land in the spacing between rows
+
+        first_index = self.indexAt(QPoint(x, rect.top()))
+        if not first_index.isValid():
+            first_index = self.indexAt(QPoint(x, rect.top() + gap))
+        if not first_index.isValid():
+            return None
+        last_index = self.indexAt(QPoint(x, rect.bottom()))
+        if not last_index.isValid():
+            last_index = self.indexAt(QPoint(x, rect.bottom() - gap))
+        # Still nothing at the bottom: the list ends inside the viewport
+        last_row = last_index.row() if last_index.isValid() else self.model().rowCount() - 1
+        return first_index.row(), last_row
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.viewport_resized.emit()
 
     def mousePressEvent(self, event):
-        """Handles clicks directly on the row's background area."""
-        if event.button() == Qt.MouseButton.LeftButton:
-             # Tell MainWindow to select this item
-             self.main_window.handle_row_interaction(self.list_item, toggle_label=False)
-        super().mousePressEvent(event)
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        was_current = index.isValid() and index == self.currentIndex()
+        super().mousePressEvent(event) # Selects clicked row as usual
+        if was_current and event.button() == Qt.MouseButton.LeftButton:
+            if self.itemDelegate().thumbnail_rect(self.visualRect(index), index).contains(pos):
+                self.thumbnail_clicked.emit(index)
+
+    def mouseDoubleClickEvent(self, event):
+        # Rapid clicks on a thumbnail toggle twice, like two single clicks
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        if (index.isValid() and index == self.currentIndex() and event.button() == Qt.MouseButton.LeftButton
+                and self.itemDelegate().thumbnail_rect(self.visualRect(index), index).contains(pos)):
+            self.thumbnail_clicked.emit(index)
+            return
+        super().mouseDoubleClickEvent(event)
+
+    def keyPressEvent(self, event):
+        # Labeling keys belong to MainWindow; don't let them trigger keyboard search or navigation
+        if event.key() in (Qt.Key.Key_A, Qt.Key.Key_D, Qt.Key.Key_Left, Qt.Key.Key_Right,
+                           Qt.Key.Key_Enter, Qt.Key.Key_Return):
+            event.ignore()
+            return
+        super().keyPressEvent(event)
 
 
-# --- MainWindow (Refactored to use QListWidget) ---
+# --- MainWindow ---
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -218,19 +611,53 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
 
         # --- Internal State ---
-        # image_data: {path: {'initial_label': str, 'current_label': str}}
-        # We no longer store the widget directly here, we get it from the QListWidget item
+        # image_data: {path: {'path': str, 'basename': str, 'initial_label': str, 'current_label': str}}
+        # The same record dicts back the rows of self.list_model
         self.image_data = {}
         self.root_folder = None
         self.current_thumbnail_size_key = DEFAULT_THUMBNAIL_SIZE
         self.current_thumbnail_bound_px = THUMBNAIL_SIZES[self.current_thumbnail_size_key]
-        self.pending_changes = 0
-        self.log_entries = []
+        self._dirty_paths = set() # Paths whose current_label differs from initial_label; its size is the pending count
+        self.log_entries = deque(maxlen=MAX_LOG_LINES) # Oldest entries drop off automatically
+        self._log_console_dirty = False
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         self.log_save_timer = QTimer(self)
         self.log_save_timer.timeout.connect(self.save_log_file)
+        # Single writer thread: log snapshots reach the disk in the order they were taken
+        self.log_write_pool = QThreadPool(self)
+        self.log_write_pool.setMaxThreadCount(1)
+        self.log_write_signals = LogWriteSignals(self)
+        self.log_write_signals.failed.connect(self.on_log_write_failed)
         self.log_needs_saving = False
+        self._last_log_write = 0.0 # time.monotonic() of the last log file write
         self.selected_image_path = None
-        # self.ordered_paths = [] # No longer needed, QListWidget maintains order
+        self._current_row = -1 # Row of the current index, tracked from currentChanged
+        # self.ordered_paths = [] # No longer needed, the list model maintains order
+
+        # --- Background Thumbnail Loading ---
+        # (path, size_bound) pairs waiting for a ThumbnailTask result
+        self._pending_thumbnails = set()
+        # Paths whose image could not be decoded; painted as "Load Error"
+        self.failed_thumbnails = set()
+        # (path, size_bound) pairs cached as a fast, nearest-neighbour zoom preview
+        self._rough_thumbnails = set()
+        # {(path, size_bound): QPixmapCache.Key}; integer keys avoid building and hashing a string per paint
+        self._pixcache_keys = {}
+        self._resmooth_timer = QTimer(self)
+        self._resmooth_timer.setSingleShot(True)
+        self._resmooth_timer.setInterval(RESMOOTH_DELAY_MS)
+        self._resmooth_timer.timeout.connect(self._resmooth_visible)
+        self.thumbnail_pool = QThreadPool.globalInstance()
+        # Own pool for the startup cache prune, so clearing thumbnail_pool can't drop it
+        self.cache_prune_pool = QThreadPool(self)
+        self.cache_prune_pool.setMaxThreadCount(1)
+        self.thumbnail_signals = ThumbnailSignals(self)
+        self.thumbnail_signals.finished.connect(self.on_thumbnail_ready)
+
+        # --- Persistent Thumbnail Cache (survives restarts, unlike QPixmapCache) ---
+        self.thumbnail_cache_dir = self.setup_thumbnail_cache_dir()
 
         # --- Main UI Structure ---
         self.central_widget = QWidget()
@@ -242,19 +669,62 @@ class MainWindow(QMainWindow):
         # --- Top Bar Elements ---
         self.setup_top_bar()
 
-        # --- List Widget for Image Rows ---
-        self.setup_list_widget() # Changed from setup_scroll_area
+        # --- List View for Image Rows ---
+        self.setup_list_view()
 
         # --- Log Console ---
         self.setup_log_console()
 
+        # --- Keyboard Shortcuts ---
+        self.setup_key_actions()
+
         # --- Initialize Image Cache ---
-        QPixmapCache.setCacheLimit(200 * 1024 * 1024)
+        QPixmapCache.setCacheLimit(memory_cache_limit() // 1024) # Limit is in KB
 
         # --- Initial Status ---
         self.log_action("Application started.")
         self.update_counters()
 
+    def setup_key_actions(self):
+        """Builds the key -> action tables used by keyPressEvent (one dict lookup per key press)."""
+        ctrl = Qt.KeyboardModifier.ControlModifier
+        # Global shortcuts, matched on (key, modifiers)
+        self._global_key_actions = {
+            (Qt.Key.Key_O, ctrl): self.select_folder,
+            (Qt.Key.Key_S, ctrl): self.apply_changes,
+        }
+        # Zoom keys work with any modifiers (e.g. Shift for '+', keypad)
+        self._zoom_key_actions = {
+            Qt.Key.Key_Plus: "in",
+            Qt.Key.Key_Equal: "in",
+            Qt.Key.Key_Minus: "out",
+        }
+        # Labeling shortcuts, called with the selected row's path
+        self._label_key_actions = {
+            Qt.Key.Key_A: lambda path: self.change_selected_label('not_center'),
+            Qt.Key.Key_Left: lambda path: self.change_selected_label('not_center'),
+            Qt.Key.Key_D: lambda path: self.change_selected_label('center'),
+            Qt.Key.Key_Right: lambda path: self.change_selected_label('center'),
+            Qt.Key.Key_Enter: self.toggle_image_label,
+            Qt.Key.Key_Return: self.toggle_image_label,
+        }
+
+    def setup_thumbnail_cache_dir(self):
+        """Creates the on-disk thumbnail cache directory and prunes it in the background.
+
+        Returns None (disk cache disabled) if no writable cache location exists.
+        """
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        if not cache_root: return None
+        cache_dir = os.path.join(cache_root, "thumbnails")
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Warning: Thumbnail disk cache disabled, cannot create {cache_dir}: {e}")
+            return None
+        self.cache_prune_pool.start(lambda: prune_disk_cache(cache_dir, DISK_CACHE_LIMIT))
+        return cache_dir
+
     # setup_top_bar remains the same
     def setup_top_bar(self):
         """Creates and configures the top bar widgets."""
@@ -302,23 +772,43 @@ class MainWindow(QMainWindow):
 
         self.main_layout.addWidget(self.top_bar)
 
-    # Refactored to use QListWidget
-    def setup_list_widget(self):
-        """Creates and configures the QListWidget for image rows."""
-        self.list_widget = QListWidget()
-        self.list_widget.setSpacing(4) # Spacing between items
-        self.list_widget.setStyleSheet("QListWidget { border: none; background-color: #f0f0f0; }")
+    # Model/delegate based list, no per-row widgets
+    def setup_list_view(self):
+        """Creates and configures the QListView, its model and row delegate."""
+        self.list_model = ImageListModel(self)
+        self.list_delegate = ImageDelegate(self, self.current_thumbnail_bound_px, self)
+        self.list_view = ImageListView()
+        self.list_view.setModel(self.list_model)
+        self.list_view.setItemDelegate(self.list_delegate)
+        self.list_view.setSpacing(4) # Spacing between items
+        # Palette + frame shape instead of a stylesheet: the view keeps the native style
+        # and repaints don't go through the stylesheet engine
+        self.list_view.setFrameShape(QFrame.Shape.NoFrame)
+        list_palette = self.list_view.palette()
+        list_palette.setColor(QPalette.ColorRole.Base, QColor("#f0f0f0"))
+        self.list_view.setPalette(list_palette)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         # Ensure vertical scrollbar appears when needed
-        self.list_widget.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-        self.list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-
-        # Connect selection signal
-        self.list_widget.currentItemChanged.connect(self.on_current_item_changed)
-        # Optional: Connect click signal if needed for specific interaction
-        # self.list_widget.itemClicked.connect(self.on_item_clicked)
-
-        self.main_layout.addWidget(self.list_widget, 1) # List widget takes expanding space
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.list_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+
+        # Connect selection and thumbnail click signals
+        self.list_view.selectionModel().currentChanged.connect(self.on_current_changed)
+        self.list_view.thumbnail_clicked.connect(self.on_thumbnail_clicked)
+
+        # Thumbnails are only decoded for rows in (or near) the viewport.
+        # Scroll/resize/model changes are coalesced into one request pass per event loop turn.
+        self._visible_thumbnails_timer = QTimer(self)
+        self._visible_thumbnails_timer.setSingleShot(True)
+        self._visible_thumbnails_timer.setInterval(0)
+        self._visible_thumbnails_timer.timeout.connect(self.request_visible_thumbnails)
+        self.list_view.verticalScrollBar().valueChanged.connect(lambda _value: self.schedule_visible_thumbnails())
+        self.list_view.viewport_resized.connect(self.schedule_visible_thumbnails)
+        self.list_model.rowsInserted.connect(lambda *_args: self.schedule_visible_thumbnails())
+        self.list_model.layoutChanged.connect(lambda *_args: self.schedule_visible_thumbnails())
+
+        self.main_layout.addWidget(self.list_view, 1) # List view takes expanding space
 
     # setup_log_console remains the same
     def setup_log_console(self):
@@ -330,26 +820,27 @@ class MainWindow(QMainWindow):
         self.log_console.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.main_layout.addWidget(self.log_console)
 
-    # log_action and save_log_file remain the same
     def log_action(self, message, is_error=False):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {'ERROR: ' if is_error else ''}{message}"
         self.log_entries.append(log_entry)
-        if hasattr(self, 'log_console') and self.log_console:
-             self.log_console.append(log_entry)
-             doc = self.log_console.document()
-             if doc.blockCount() > MAX_LOG_LINES * 1.1:
-                  cursor = self.log_console.textCursor()
-                  cursor.movePosition(QTextCursor.MoveOperation.Start)
-                  cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.KeepAnchor, doc.blockCount() - MAX_LOG_LINES)
-                  cursor.removeSelectedText()
-                  cursor.movePosition(QTextCursor.MoveOperation.End)
-                  self.log_console.setTextCursor(cursor)
-             self.log_console.ensureCursorVisible()
+        # The console is refreshed at most once per LOG_FLUSH_INTERVAL, not per message
+        self._log_console_dirty = True
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start(LOG_FLUSH_INTERVAL)
         self.log_needs_saving = True
         if hasattr(self, 'log_save_timer') and not self.log_save_timer.isActive():
             self.log_save_timer.start(LOG_SAVE_INTERVAL)
 
+    @Slot()
+    def _flush_log(self):
+        """Shows the buffered log entries in the console with a single document update."""
+        if not self._log_console_dirty or not hasattr(self, 'log_console'): return
+        self._log_console_dirty = False
+        self.log_console.setPlainText("\n".join(self.log_entries))
+        self.log_console.moveCursor(QTextCursor.MoveOperation.End)
+        self.log_console.ensureCursorVisible()
+
     @Slot()
     def save_log_file(self):
         if not self.root_folder or not self.log_needs_saving:
@@ -357,14 +848,31 @@ class MainWindow(QMainWindow):
             return
         log_file_path = os.path.join(self.root_folder, "image_review_log.json")
         try:
-            entries_to_save = self.log_entries[-MAX_LOG_LINES:]
-            with open(log_file_path, 'w') as f: json.dump(entries_to_save, f, indent=2)
+            data = serialize_log(list(self.log_entries)) # Already capped at MAX_LOG_LINES
+            self.log_write_pool.start(LogWriteTask(log_file_path, data, self.log_write_signals))
             self.log_needs_saving = False
+            self._last_log_write = time.monotonic()
         except Exception as e:
             self.log_action(f"Failed to save log file to {log_file_path}: {e}", is_error=True)
         finally:
             if hasattr(self, 'log_save_timer'): self.log_save_timer.stop()
 
+    def request_log_save(self):
+        """Saves the log now, or once LOG_MIN_WRITE_INTERVAL has passed since the last write."""
+        elapsed_ms = (time.monotonic() - self._last_log_write) * 1000
+        if elapsed_ms >= LOG_MIN_WRITE_INTERVAL:
+            self.save_log_file()
+        else:
+            self.log_save_timer.start(int(LOG_MIN_WRITE_INTERVAL - elapsed_ms)) # Coalesces repeated requests
+
+    @Slot(str, str)
+    def on_log_write_failed(self, log_file_path, error):
+        self.log_action(f"Failed to save log file to {log_file_path}: {error}", is_error=True)
+        # Don't retry on the timer: the same write would just fail (and log) again every interval.
+        # The error entry is saved with the next write triggered by a later action.
+        self.log_needs_saving = False
+        self.log_save_timer.stop()
+
     # select_folder remains the same
     @Slot()
     def select_folder(self):
@@ -392,50 +900,59 @@ class MainWindow(QMainWindow):
 
     # clear_layout is no longer needed for rows
 
-    # Refactored clear_images for QListWidget
     def clear_images(self):
         """Clears all loaded image data, UI list items, and resets related state."""
         if hasattr(self, 'log_save_timer') and self.log_save_timer.isActive():
             self.log_save_timer.stop()
 
+        # Drop queued thumbnail work for the previous folder; running tasks finish and are ignored
+        if hasattr(self, 'thumbnail_pool'):
+            self.thumbnail_pool.clear()
+            self._pending_thumbnails.clear() # In-place: tasks share this set
+            self.failed_thumbnails = set()
+            self._rough_thumbnails = set()
+
         # Block signals during clear to avoid triggering selection changes
-        if hasattr(self, 'list_widget'):
-            self.list_widget.blockSignals(True)
-            self.list_widget.clear() # Clears items and removes item widgets
-            self.list_widget.blockSignals(False)
+        if hasattr(self, 'list_model'):
+            self.list_view.selectionModel().blockSignals(True)
+            self.list_model.clear()
+            self.list_delegate.clear_text_heights()
+            self.list_view.selectionModel().blockSignals(False)
 
         self.image_data = {}
         self.selected_image_path = None
-        self.pending_changes = 0
+        self._current_row = -1
+        self._dirty_paths = set()
         QPixmapCache.clear()
+        self._pixcache_keys = {}
         self.update_counters()
         if hasattr(self, 'btn_apply_changes'):
             self.btn_apply_changes.setEnabled(False)
         self.log_action("Image cache and UI cleared.")
 
-    # Refactored load_images for QListWidget
     def load_images(self):
-        """Scans the selected folder, loads images, and populates the QListWidget."""
+        """Scans the selected folder, loads images, and populates the list model."""
         if not self.root_folder:
             self.log_action("Cannot load images, no root folder selected.", is_error=True)
             return
 
         self.clear_images() # Start fresh
         self.log_action("Loading images...")
-        center_dir = os.path.join(self.root_folder, "center")
-        not_center_dir = os.path.join(self.root_folder, "not_center")
+        root_folder = os.path.abspath(self.root_folder) # Once, so per-file paths are already absolute
+        center_dir = os.path.join(root_folder, "center")
+        not_center_dir = os.path.join(root_folder, "not_center")
         image_files = []
 
-        supported_extensions = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff')
         for label, directory in [("center", center_dir), ("not_center", not_center_dir)]:
             try:
                 if not os.path.isdir(directory):
                     self.log_action(f"Directory not found: {directory}", is_error=True)
                     continue
-                for filename in os.listdir(directory):
-                    if filename.lower().endswith(supported_extensions):
-                        full_path = os.path.abspath(os.path.join(directory, filename))
-                        image_files.append((full_path, label))
+                # scandir yields the file type with each entry, saving a stat per file
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS and entry.is_file():
+                            image_files.append((os.path.join(directory, entry.name), entry.name, label))
             except Exception as e:
                  self.log_action(f"Error reading directory {directory}: {e}", is_error=True)
 
@@ -444,131 +961,257 @@ class MainWindow(QMainWindow):
             self.update_counters()
             return
 
-        image_files.sort(key=lambda item: os.path.basename(item[0]))
+        image_files.sort(key=lambda item: item[1]) # Sort by file name
 
-        # --- Populate UI with QListWidgetItems ---
-        self.list_widget.blockSignals(True) # Block signals during population
+        # --- Populate the list model ---
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        total_files = len(image_files)
         try:
-            for i, (full_path, label) in enumerate(image_files):
+            records = []
+            for full_path, name, label in image_files:
                 if full_path not in self.image_data:
-                    # Store image info (without widget ref now)
-                    self.image_data[full_path] = {
+                    img_info = {
+                        'path': full_path,
+                        'basename': name, # Computed once; moves keep the file name
                         'initial_label': label,
                         'current_label': label
                     }
+                    self.image_data[full_path] = img_info
+                    records.append(img_info)
+            # One rowsInserted for the whole folder; visible rows get their thumbnails queued
+            self.list_model.append_rows(records)
+        finally:
+            QApplication.restoreOverrideCursor()
 
-                    # Create List Item and store path
-                    list_item = QListWidgetItem(self.list_widget) # Add item to list
-                    list_item.setData(ImagePathRole, full_path)
+        self.update_counters()
+        self.log_action(f"Loaded {len(self.image_data)} images.")
+        # Select the first row if list is not empty
+        if self.list_model.rowCount() > 0:
+             QTimer.singleShot(0, lambda: self.list_view.setCurrentIndex(self.list_model.index(0))) # Triggers on_current_changed
+
+    def cached_thumbnail(self, path, size_bound):
+        """Returns the cached thumbnail pixmap for path at size_bound, or None."""
+        key = self._pixcache_keys.get((path, size_bound))
+        if key is None: return None
+        pixmap = QPixmapCache.find(key)
+        if not pixmap or pixmap.isNull():
+            del self._pixcache_keys[(path, size_bound)] # Evicted by QPixmapCache
+            return None
+        return pixmap
+
+    def store_thumbnail(self, path, size_bound, pixmap):
+        """Caches pixmap as the thumbnail for path at size_bound, replacing any previous one."""
+        self.drop_thumbnail(path, size_bound)
+        self._pixcache_keys[(path, size_bound)] = QPixmapCache.insert(pixmap)
+
+    def rename_thumbnails(self, renames):
+        """Re-keys the cached thumbnails of moved files (every zoom level); renames is {old_path: new_path}.
+
+        Everything is taken off the old paths before anything is stored under the new
+        ones, so a new path that is another moved file's old path (a swap) keeps the
+        right pixmap instead of overwriting or orphaning it.
+        """
+        size_bounds = THUMBNAIL_SIZES.values()
+        keys, rough, failed = [], [], []
+        for old_path, new_path in renames.items():
+            for size_bound in size_bounds:
+                key = self._pixcache_keys.pop((old_path, size_bound), None)
+                if key is not None:
+                    keys.append(((new_path, size_bound), key)) # The pixmap itself stays in place
+                if (old_path, size_bound) in self._rough_thumbnails:
+                    self._rough_thumbnails.discard((old_path, size_bound))
+                    rough.append((new_path, size_bound))
+                self._pending_thumbnails.discard((old_path, size_bound)) # Its result would be for the old path
+            if old_path in self.failed_thumbnails:
+                self.failed_thumbnails.discard(old_path)
+                failed.append(new_path)
+        for cache_key, key in keys:
+            self.drop_thumbnail(*cache_key) # Only a file not moved away can still own the new path
+            self._pixcache_keys[cache_key] = key
+        self._rough_thumbnails.update(rough)
+        self.failed_thumbnails.update(failed)
+
+    def drop_thumbnail(self, path, size_bound):
+        """Removes the cached thumbnail for path at size_bound, if any."""
+        key = self._pixcache_keys.pop((path, size_bound), None)
+        if key is not None:
+            QPixmapCache.remove(key)
+
+    def request_thumbnail(self, path, size_bound):
+        """Queues background decoding of a thumbnail unless it is already queued."""
+        if (path, size_bound) in self._pending_thumbnails: return
+        self._pending_thumbnails.add((path, size_bound))
+        task = ThumbnailTask(path, size_bound, self.thumbnail_signals, self._pending_thumbnails,
+                             self.thumbnail_cache_dir)
+        self.thumbnail_pool.start(task)
 
-                    # Create the custom widget for the item
-                    row_widget = ImageRowWidget(
-                        full_path, label, self.current_thumbnail_bound_px, self, list_item
-                    )
+    @Slot()
+    def schedule_visible_thumbnails(self):
+        """Requests a (coalesced) refresh of the thumbnails needed by the viewport."""
+        self._visible_thumbnails_timer.start()
 
-                    # Set item's size hint based on widget's initial size
-                    list_item.setSizeHint(row_widget.sizeHint())
+    def thumbnail_rows(self):
+        """Returns (first, last) of the rows in view plus the prefetch margin, or None if the list is empty."""
+        visible_rows = self.list_view.visible_rows()
+        if visible_rows is None: return None
+        return (max(0, visible_rows[0] - THUMBNAIL_PREFETCH_ROWS),
+                min(self.list_model.rowCount() - 1, visible_rows[1] + THUMBNAIL_PREFETCH_ROWS))
 
-                    # Associate the widget with the item
-                    self.list_widget.setItemWidget(list_item, row_widget)
+    @Slot()
+    def request_visible_thumbnails(self):
+        """Queues missing thumbnails for rows in the viewport plus a small prefetch margin."""
+        thumbnail_rows = self.thumbnail_rows()
+        if thumbnail_rows is None: return
+        first_row, last_row = thumbnail_rows
+
+        size_bound = self.current_thumbnail_bound_px
+        # Zoom previews are upgraded too, unless the user may still be zooming
+        replace_rough = not self._resmooth_timer.isActive()
+        wanted = set()
+        for row in range(first_row, last_row + 1):
+            path = self.list_model.row_info(row)['path']
+            if path in self.failed_thumbnails: continue
+            if not self.cached_thumbnail(path, size_bound) or \
+               (replace_rough and (path, size_bound) in self._rough_thumbnails):
+                if not self.scale_from_larger_thumbnail(path, size_bound):
+                    wanted.add((path, size_bound))
+
+        # Forget rows that scrolled out of range; their queued tasks skip decoding
+        self._pending_thumbnails.intersection_update(wanted)
+        for path, size_bound in wanted:
+            self.request_thumbnail(path, size_bound)
+
+    @Slot(str, int, QImage)
+    def on_thumbnail_ready(self, image_path, thumbnail_size_bound, image):
+        """Receives a decoded thumbnail on the GUI thread and repaints the list."""
+        if (image_path, thumbnail_size_bound) not in self._pending_thumbnails:
+            return # Folder was cleared or reloaded meanwhile
+        self._pending_thumbnails.discard((image_path, thumbnail_size_bound))
+
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image) # Cheap now that decoding and scaling are done
+            self.store_thumbnail(image_path, thumbnail_size_bound, pixmap) # Replaces a zoom preview
+            self._rough_thumbnails.discard((image_path, thumbnail_size_bound))
+        else:
+            print(f"Warning: Failed to load pixmap for {os.path.basename(image_path)}")
+            self.failed_thumbnails.add(image_path)
+
+        # Results for an outdated zoom level only fill the cache
+        if thumbnail_size_bound == self.list_delegate.thumbnail_size_bound:
+            row = self.list_model.find_row(image_path)
+            if row >= 0:
+                self.list_view.update(self.list_model.index(row)) # Repaints just this row, if visible
+
+    def scale_from_larger_thumbnail(self, path, size_bound):
+        """Derives a thumbnail from a larger one already in memory instead of decoding the file.
+
+        Returns the new (cached) pixmap, or None if no larger smooth thumbnail is cached.
+        """
+        for larger_bound in sorted(bound for bound in THUMBNAIL_SIZES.values() if bound > size_bound):
+            if (path, larger_bound) in self._rough_thumbnails: continue # Never derive from a preview
+            larger_pixmap = self.cached_thumbnail(path, larger_bound)
+            if larger_pixmap:
+                # Downscaling an in-memory thumbnail is cheap even with the smooth filter
+                pixmap = larger_pixmap.scaled(size_bound, size_bound, Qt.AspectRatioMode.KeepAspectRatio,
+                                              Qt.TransformationMode.SmoothTransformation)
+                self.store_thumbnail(path, size_bound, pixmap)
+                self._rough_thumbnails.discard((path, size_bound))
+                return pixmap
+        return None
 
-                    if i % 50 == 0 or i == total_files - 1:
-                         progress = int(((i + 1) / total_files) * 100)
-                         self.progress_bar.setValue(progress)
-                         QApplication.processEvents()
-        finally:
-            self.list_widget.blockSignals(False) # Re-enable signals
-            QApplication.restoreOverrideCursor()
+    def preview_visible_thumbnails(self, old_bound_px, new_bound_px):
+        """Rescales thumbnails in (and near) the viewport from the old zoom level with the fast filter.
+
+        Gives instant feedback while zooming; _resmooth_visible replaces the
+        previews with properly filtered thumbnails once zooming stops. When
+        zooming out, the final thumbnail is derived from the larger one directly.
+        """
+        thumbnail_rows = self.thumbnail_rows()
+        if thumbnail_rows is None: return
+        # Rows just outside the viewport too, so scrolling right after a zoom shows no placeholders;
+        # rows further away keep no thumbnail at the new size until they come into range
+        for row in range(thumbnail_rows[0], thumbnail_rows[1] + 1):
+            path = self.list_model.row_info(row)['path']
+            if self.cached_thumbnail(path, new_bound_px): continue
+            if self.scale_from_larger_thumbnail(path, new_bound_px): continue
+            old_pixmap = self.cached_thumbnail(path, old_bound_px)
+            if not old_pixmap: continue
+            preview = old_pixmap.scaled(new_bound_px, new_bound_px, Qt.AspectRatioMode.KeepAspectRatio,
+                                        Qt.TransformationMode.FastTransformation)
+            self.store_thumbnail(path, new_bound_px, preview)
+            self._rough_thumbnails.add((path, new_bound_px))
 
-        self.update_counters()
-        self.log_action(f"Loaded {len(self.image_data)} images.")
-        # Select the first item if list is not empty
-        if self.list_widget.count() > 0:
-             QTimer.singleShot(0, lambda: self.list_widget.setCurrentRow(0)) # Triggers on_current_item_changed
-
-    # Slot for QListWidget's currentItemChanged signal
-    @Slot(QListWidgetItem, QListWidgetItem)
-    def on_current_item_changed(self, current_item, previous_item):
-        """Handles selection changes in the QListWidget."""
-        if previous_item:
-            prev_widget = self.list_widget.itemWidget(previous_item)
-            if isinstance(prev_widget, ImageRowWidget):
-                prev_widget.set_selected_style(False)
-
-        if current_item:
-            current_path = current_item.data(ImagePathRole)
-            current_widget = self.list_widget.itemWidget(current_item)
-            if isinstance(current_widget, ImageRowWidget):
-                 current_widget.set_selected_style(True)
-                 # Ensure the newly selected item is visible
-                 self.list_widget.scrollToItem(current_item, QAbstractItemView.ScrollHint.EnsureVisible)
+    @Slot()
+    def _resmooth_visible(self):
+        """Queues smooth thumbnails for the zoom previews currently in view."""
+        self.request_visible_thumbnails()
+
+    # Slot for the selection model's currentChanged signal
+    @Slot(QModelIndex, QModelIndex)
+    def on_current_changed(self, current, previous):
+        """Handles selection changes in the list view."""
+        self._current_row = current.row() # -1 for an invalid index
+        if current.isValid():
+            current_path = current.data(ImagePathRole)
+            # Ensure the newly selected row is visible
+            self.list_view.scrollTo(current, QAbstractItemView.ScrollHint.EnsureVisible)
 
             if current_path != self.selected_image_path:
                 self.selected_image_path = current_path
-                self.update_counters() # Update counters based on new selection
+                self._refresh_index_label() # Selection alone never changes the pending count
         else:
             self.selected_image_path = None
-            self.update_counters()
+            self._refresh_index_label()
 
-    # Combined handler for clicks on row background or thumbnail
-    def handle_row_interaction(self, list_item, toggle_label):
-        """Handles clicks originating from ImageRowWidget or its thumbnail."""
-        if not list_item: return
-        path = list_item.data(ImagePathRole)
-        if path not in self.image_data: return
-
-        is_already_selected = (list_item == self.list_widget.currentItem())
-
-        if is_already_selected and toggle_label:
-             self.toggle_image_label(path) # Clicked thumbnail of selected -> toggle
-        elif not is_already_selected:
-             self.list_widget.setCurrentItem(list_item) # Clicked different row -> select
-        # Else (clicked background of already selected and toggle_label=False) -> do nothing
+    # Clicks on a row background are handled by the view itself (selection)
+    @Slot(QModelIndex)
+    def on_thumbnail_clicked(self, index):
+        """Toggles the label when the thumbnail of the selected row is clicked."""
+        path = index.data(ImagePathRole)
+        if path in self.image_data:
+            self.toggle_image_label(path)
 
-    # Refactored toggle_image_label for QListWidget context
     def toggle_image_label(self, path):
         """Toggles the current_label of the image and updates UI + pending changes."""
         if path in self.image_data:
             img_info = self.image_data[path]
-            # Find the list item and its widget
-            list_item = self.find_list_item_by_path(path)
-            if not list_item: return
-            row_widget = self.list_widget.itemWidget(list_item)
-            if not isinstance(row_widget, ImageRowWidget): return
+            row = self.list_model.find_row(path)
+            if row < 0: return
 
             old_label = img_info['current_label']
             new_label = 'not_center' if old_label == 'center' else 'center'
 
             img_info['current_label'] = new_label
-            row_widget.set_label(new_label) # Update row widget's state/layout
-            self.log_action(f"Toggled '{os.path.basename(path)}' from '{old_label}' to '{new_label}'")
+            self.list_model.notify_row_changed(row) # Delegate repaints the row with the new thumbnail position
+            self.log_action(f"Toggled '{img_info['basename']}' from '{old_label}' to '{new_label}'")
 
             # Update Pending Changes Count (logic remains the same)
             is_now_different = (img_info['current_label'] != img_info['initial_label'])
             was_different_before = (old_label != img_info['initial_label'])
             pending_change_updated = False
             if is_now_different and not was_different_before:
-                self.pending_changes += 1; pending_change_updated = True
+                self._dirty_paths.add(path); pending_change_updated = True
             elif not is_now_different and was_different_before:
-                 self.pending_changes -= 1; pending_change_updated = True
+                 self._dirty_paths.discard(path); pending_change_updated = True
 
             if pending_change_updated:
                 self.update_counters()
                 if hasattr(self, 'btn_apply_changes'):
-                    self.btn_apply_changes.setEnabled(self.pending_changes > 0)
+                    self.btn_apply_changes.setEnabled(len(self._dirty_paths) > 0)
 
-    # Refactored update_counters for QListWidget
     def update_counters(self):
         """Updates the image count label, pending changes label, and progress bar."""
-        total_images = self.list_widget.count() # Get count from list widget
+        self._refresh_index_label()
+        if hasattr(self, 'lbl_pending_changes'):
+            self.lbl_pending_changes.setText(f"{len(self._dirty_paths)} changes pending")
+
+    def _refresh_index_label(self):
+        """Updates only the image count label and progress bar (e.g. after a selection change)."""
+        total_images = self.list_model.rowCount() # Get count from list model
         current_index_display = "-"
         progress_value = 0
 
-        current_item = self.list_widget.currentItem()
-        if total_images > 0 and current_item:
-            current_row = self.list_widget.row(current_item)
+        current_row = self._current_row
+        if total_images > 0 and current_row >= 0:
             current_index_display = current_row + 1
             progress_value = int(((current_row + 1) / total_images) * 100)
         elif total_images > 0:
@@ -578,171 +1221,191 @@ class MainWindow(QMainWindow):
 
         if hasattr(self, 'lbl_image_count'):
             self.lbl_image_count.setText(f"Image {current_index_display} / {total_images}")
-        if hasattr(self, 'lbl_pending_changes'):
-            self.lbl_pending_changes.setText(f"{self.pending_changes} changes pending")
         if hasattr(self, 'progress_bar'):
             self.progress_bar.setValue(progress_value)
 
-    # Helper to find QListWidgetItem by stored path
-    def find_list_item_by_path(self, path):
-        """Finds the QListWidgetItem associated with a given image path."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(ImagePathRole) == path:
-                return item
-        return None
+    # Helper to find the model index of a stored path
+    def find_index_by_path(self, path):
+        """Finds the model index associated with a given image path (invalid if not found)."""
+        row = self.list_model.find_row(path)
+        return self.list_model.index(row) if row >= 0 else QModelIndex()
 
-    # Refactored select_image_by_path for QListWidget
     def select_image_by_path(self, path):
-        """Selects the list item corresponding to the given path."""
-        item_to_select = self.find_list_item_by_path(path)
-        if item_to_select:
-            # Setting current item triggers on_current_item_changed, which handles styling and state updates
-            self.list_widget.setCurrentItem(item_to_select)
+        """Selects the list row corresponding to the given path."""
+        index_to_select = self.find_index_by_path(path)
+        if index_to_select.isValid():
+            # Setting the current index triggers on_current_changed, which handles state updates
+            self.list_view.setCurrentIndex(index_to_select)
         else:
              self.log_action(f"Error: Could not find list item for path: {path}", is_error=True)
 
 
-    # Refactored select_next/previous_image for QListWidget
     def select_next_image(self):
-        """Selects the next item in the QListWidget."""
-        current_row = self.list_widget.currentRow()
+        """Selects the next row in the list view."""
+        current_row = self._current_row
         next_row = current_row + 1
-        if 0 <= next_row < self.list_widget.count():
-            self.list_widget.setCurrentRow(next_row)
-        elif self.list_widget.count() > 0:
+        if 0 <= next_row < self.list_model.rowCount():
+            self.list_view.setCurrentIndex(self.list_model.index(next_row))
+        elif self.list_model.rowCount() > 0:
              self.log_action("Reached the last image.")
-             # Optionally wrap around: self.list_widget.setCurrentRow(0)
+             # Optionally wrap around: self.list_view.setCurrentIndex(self.list_model.index(0))
 
     def select_previous_image(self):
-        """Selects the previous item in the QListWidget."""
-        current_row = self.list_widget.currentRow()
+        """Selects the previous row in the list view."""
+        current_row = self._current_row
         prev_row = current_row - 1
         if prev_row >= 0:
-            self.list_widget.setCurrentRow(prev_row)
-        elif current_row == 0 and self.list_widget.count() > 0:
+            self.list_view.setCurrentIndex(self.list_model.index(prev_row))
+        elif current_row == 0 and self.list_model.rowCount() > 0:
              self.log_action("Reached the first image.")
-             # Optionally wrap around: self.list_widget.setCurrentRow(self.list_widget.count() - 1)
+             # Optionally wrap around: self.list_view.setCurrentIndex(self.list_model.index(self.list_model.rowCount() - 1))
 
     # change_selected_label remains conceptually the same (operates on self.selected_image_path)
     def change_selected_label(self, target_label):
          """Changes the label of the currently selected image."""
-         current_item = self.list_widget.currentItem()
-         if current_item:
-             path = current_item.data(ImagePathRole)
+         current_index = self.list_view.currentIndex()
+         if current_index.isValid():
+             path = current_index.data(ImagePathRole)
              if path and path in self.image_data:
                  img_info = self.image_data[path]
                  if img_info['current_label'] != target_label:
                      self.toggle_image_label(path) # toggle_image_label handles UI and state
 
-    # Refactored apply_changes for QListWidget
     @Slot()
     def apply_changes(self):
-        """Moves files and updates internal state and QListWidget items."""
-        if not self.root_folder or self.pending_changes == 0:
-            if self.pending_changes == 0: self.log_action("No pending changes to apply.")
+        """Moves files and updates internal state and list model rows."""
+        if not self.root_folder or not self._dirty_paths:
+            if not self._dirty_paths: self.log_action("No pending changes to apply.")
             return
 
-        self.log_action(f"Applying {self.pending_changes} changes...")
+        self.log_action(f"Applying {len(self._dirty_paths)} changes...")
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        self.list_widget.blockSignals(True) # Block signals during update
+        self.list_view.selectionModel().blockSignals(True) # Block signals during update
 
         moved_count = 0
         error_count = 0
         paths_to_update_in_data = {} # {old_path: new_path}
 
-        items_to_process = list(self.image_data.items()) # Process a copy
-
-        for path, img_info in items_to_process:
-            if img_info['current_label'] != img_info['initial_label']:
-                # File move logic (same as before)
-                initial_dir = os.path.join(self.root_folder, img_info['initial_label'])
-                target_dir = os.path.join(self.root_folder, img_info['current_label'])
-                filename = os.path.basename(path)
-                actual_source_path = path
-                destination_path = os.path.join(target_dir, filename)
-
-                if not os.path.exists(actual_source_path):
-                     self.log_action(f"Error: Source file not found: {actual_source_path}. Skipping.", is_error=True)
-                     error_count += 1
-                     continue
-                if os.path.abspath(actual_source_path) == os.path.abspath(destination_path):
-                     self.log_action(f"Warning: Skipping move for '{filename}', source/destination identical.", is_error=True)
-                     img_info['initial_label'] = img_info['current_label']
-                     moved_count += 1
-                     continue
+        root_folder = os.path.abspath(self.root_folder) # Once; loaded paths are already absolute
+        label_dirs = {label: os.path.join(root_folder, label) for label in ("center", "not_center")}
+        dirs_created = set() # Target directories already ensured, one makedirs per directory
+        moves = [] # (path, img_info, filename, destination_path) waiting to be moved
+
+        # Only records whose label differs from the folder they are in; in list order
+        for path in sorted(self._dirty_paths, key=self.list_model.find_row):
+            img_info = self.image_data[path]
+            target_dir = label_dirs[img_info['current_label']]
+            filename = img_info['basename'] # Cached at load; moves keep the name
+            destination_path = os.path.join(target_dir, filename)
+
+            if os.path.dirname(path) == target_dir:
+                 self.log_action(f"Warning: Skipping move for '{filename}', source/destination identical.", is_error=True)
+                 img_info['initial_label'] = img_info['current_label']
+                 self._dirty_paths.discard(path)
+                 moved_count += 1
+                 continue
+            if target_dir not in dirs_created:
+                # Directories are created here, before any move is started
                 try:
                     os.makedirs(target_dir, exist_ok=True)
-                    shutil.move(actual_source_path, destination_path)
-                    self.log_action(f"Moved '{filename}' from '{img_info['initial_label']}' to '{img_info['current_label']}'")
-                    new_path = os.path.abspath(destination_path)
-                    paths_to_update_in_data[path] = new_path # Record success
-                    moved_count += 1
-                except Exception as e:
+                    dirs_created.add(target_dir)
+                except OSError as e:
                     self.log_action(f"Error: Failed to move '{filename}': {e}", is_error=True)
                     error_count += 1
+                    continue
+            moves.append((path, img_info, filename, destination_path))
+
+        # --- Collisions: concurrent moves onto an existing file or onto another move's source ---
+        # would finish in arbitrary order, so they are split off before anything is submitted
+        sources = {move[0] for move in moves}
+        parallel_moves = []
+        ordered_moves = [] # Destination is another pending move's source (chain or swap)
+        for move in moves:
+            path, _img_info, filename, destination_path = move
+            if destination_path in sources:
+                ordered_moves.append(move)
+            elif os.path.lexists(destination_path):
+                self.log_action(f"Error: Failed to move '{filename}': '{destination_path}' already exists. Skipping.", is_error=True)
+                error_count += 1
+            else:
+                parallel_moves.append(move)
+
+        # --- Run the independent moves concurrently, in batches, then the ordered ones ---
+        # Results are handled afterwards, in order, on the GUI thread
+        results = [] # (move, error or None)
+        if parallel_moves:
+            batch_size = min(MOVE_BATCH_SIZE, -(-len(parallel_moves) // MOVE_WORKERS)) # Keep every worker busy
+            batches = [parallel_moves[i:i + batch_size] for i in range(0, len(parallel_moves), batch_size)]
+            with ThreadPoolExecutor(max_workers=min(MOVE_WORKERS, len(batches))) as executor:
+                futures = [executor.submit(move_files, [(path, destination_path)
+                                                        for path, _img_info, _filename, destination_path in batch])
+                           for batch in batches]
+                for batch, future in zip(batches, futures):
+                    results.extend(zip(batch, future.result()))
+        if ordered_moves: # Their destinations are free now unless the move vacating them failed
+            results.extend(zip(ordered_moves, move_files_ordered(
+                [(path, destination_path) for path, _img_info, _filename, destination_path in ordered_moves])))
+
+        for (path, img_info, filename, destination_path), error in results:
+            if error is None:
+                self.log_action(f"Moved '{filename}' from '{img_info['initial_label']}' to '{img_info['current_label']}'")
+                paths_to_update_in_data[path] = destination_path # Record success
+                moved_count += 1
+            elif isinstance(error, FileNotFoundError):
+                # Checked here instead of a stat before every move
+                self.log_action(f"Error: Source file not found: {path}. Skipping.", is_error=True)
+                error_count += 1
+            else:
+                self.log_action(f"Error: Failed to move '{filename}': {error}", is_error=True)
+                error_count += 1
 
         # --- Batch Update Internal State and List Items After All Moves ---
-        if paths_to_update_in_data:
-            new_image_data = {}
-            current_selection_final_path = self.selected_image_path
-
-            # Iterate through list items to update paths and data
-            for i in range(self.list_widget.count()):
-                item = self.list_widget.item(i)
-                old_path = item.data(ImagePathRole)
-
-                if old_path in paths_to_update_in_data:
-                    new_path = paths_to_update_in_data[old_path]
-                    # Update item data
-                    item.setData(ImagePathRole, new_path)
-                    # Update widget paths
-                    widget = self.list_widget.itemWidget(item)
-                    if isinstance(widget, ImageRowWidget):
-                        widget.image_path = new_path
-                        widget.path_label.setToolTip(new_path)
-                        if hasattr(widget, 'thumbnail_widget'):
-                            widget.thumbnail_widget.image_path = new_path
-                        QPixmapCache.remove(f"{old_path}_{widget.thumbnail_size_bound}")
-
-                    # Update image_data dictionary key and reset initial label
-                    img_info = self.image_data.pop(old_path) # Remove old entry
+        # Only the moved records are touched: rows are found through the model's path index
+        # and image_data is re-keyed in place. Every key is re-keyed in two passes (all old
+        # paths out, then all new paths in), since a new path can be another moved file's
+        # old path when same-named files swap folders. No repaints until the batch is done,
+        # then one dataChanged per run of changed rows (row sizes don't change, so no relayout).
+        if paths_to_update_in_data: # Nothing to rename or repaint when every move failed
+            self.list_view.setUpdatesEnabled(False)
+            try:
+                self.rename_thumbnails(paths_to_update_in_data) # Next paint is a cache hit, no re-decode
+                changed_rows = self.list_model.set_row_paths(paths_to_update_in_data) # Records are shared with the rows
+
+                # Update image_data dictionary keys and reset initial labels
+                moved_records = [(new_path, self.image_data.pop(old_path))
+                                 for old_path, new_path in paths_to_update_in_data.items()]
+                for new_path, img_info in moved_records:
                     img_info['initial_label'] = img_info['current_label'] # Mark as applied
-                    new_image_data[new_path] = img_info # Add new entry
+                    self.image_data[new_path] = img_info
+                self._dirty_paths.difference_update(paths_to_update_in_data)
 
-                    # Track if selection path changed
-                    if old_path == self.selected_image_path:
-                        current_selection_final_path = new_path
-                elif old_path in self.image_data:
-                    # If not moved, just transfer existing data to new dict
-                    new_image_data[old_path] = self.image_data[old_path]
+                # Track if selection path changed
+                self.selected_image_path = paths_to_update_in_data.get(self.selected_image_path,
+                                                                       self.selected_image_path)
+                self.list_model.notify_rows_changed(changed_rows)
+            finally:
+                self.list_view.setUpdatesEnabled(True)
 
-            # Replace internal data store
-            self.image_data = new_image_data
-            self.selected_image_path = current_selection_final_path
+            # Decodes dropped by rename_thumbnails are re-queued under the new paths
+            self.schedule_visible_thumbnails()
 
         # --- Final Logging and UI Update ---
-        self.list_widget.blockSignals(False) # Re-enable signals
+        self.list_view.selectionModel().blockSignals(False) # Re-enable signals
         QApplication.restoreOverrideCursor()
         self.log_action(f"Apply changes finished. Moved: {moved_count}, Errors: {error_count}")
 
-        self.pending_changes -= moved_count
-        if self.pending_changes < 0: self.pending_changes = 0
-
         self.update_counters()
         if hasattr(self, 'btn_apply_changes'):
-            self.btn_apply_changes.setEnabled(self.pending_changes > 0)
+            self.btn_apply_changes.setEnabled(len(self._dirty_paths) > 0)
 
-        # Re-select the current item if its path changed, to ensure UI consistency
-        if self.selected_image_path:
-            self.select_image_by_path(self.selected_image_path)
+        # No re-selection needed: rows keep their position when files move, so the current index
+        # still points at the selection and the updated selected_image_path is enough
 
-        self.save_log_file()
+        self.request_log_save() # At most one log write per LOG_MIN_WRITE_INTERVAL, however often apply runs
 
 
-    # Refactored set_zoom for QListWidget
     def set_zoom(self, direction):
-        """Changes the thumbnail size and updates all list items/widgets."""
+        """Changes the thumbnail size and updates all list rows."""
         keys = list(THUMBNAIL_SIZES.keys())
         try: current_index = keys.index(self.current_thumbnail_size_key)
         except ValueError: current_index = keys.index(DEFAULT_THUMBNAIL_SIZE)
@@ -757,30 +1420,30 @@ class MainWindow(QMainWindow):
 
             if new_bound_px == self.current_thumbnail_bound_px: return
 
+            old_bound_px = self.current_thumbnail_bound_px
             self.current_thumbnail_bound_px = new_bound_px
             self.lbl_zoom_level.setText(f"Zoom: {self.current_thumbnail_size_key}")
             self.log_action(f"Zoom set to {self.current_thumbnail_size_key} (max {self.current_thumbnail_bound_px}px)")
 
-            # --- Perform bulk update of Row Widgets and Item Size Hints ---
-            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-            self.list_widget.setUpdatesEnabled(False) # Prevent flicker
+            # --- Perform bulk update of thumbnails and row sizes ---
+            # No wait cursor: nothing here decodes, missing thumbnails are queued on the worker pool
+            self.list_view.setUpdatesEnabled(False) # Prevent flicker
             try:
-                for i in range(self.list_widget.count()):
-                    item = self.list_widget.item(i)
-                    widget = self.list_widget.itemWidget(item)
-                    if isinstance(widget, ImageRowWidget):
-                        # Update widget's thumbnail and height
-                        widget.update_thumbnail_size(self.current_thumbnail_bound_px)
-                        # *** CRITICAL: Update the item's size hint ***
-                        item.setSizeHint(widget.sizeHint())
+                self.list_delegate.thumbnail_size_bound = new_bound_px
+                # *** CRITICAL: Row size hints depend on the bound, relayout the view ***
+                # (layoutChanged also queues the thumbnails now in view)
+                self.list_model.relayout()
+                # Fast previews now, smooth thumbnails once the user stops zooming
+                self._resmooth_timer.start()
+                # Old-size thumbnails stay cached (LRU eviction), so zooming back is a cache hit
+                self.preview_visible_thumbnails(old_bound_px, new_bound_px)
             finally:
-                 self.list_widget.setUpdatesEnabled(True) # Re-enable updates
-                 QApplication.restoreOverrideCursor()
+                 self.list_view.setUpdatesEnabled(True) # Re-enable updates
 
             # Ensure selection remains visible after potential size changes
-            current_item = self.list_widget.currentItem()
-            if current_item:
-                 QTimer.singleShot(0, lambda: self.list_widget.scrollToItem(current_item, QAbstractItemView.ScrollHint.EnsureVisible))
+            current_index = self.list_view.currentIndex()
+            if current_index.isValid():
+                 QTimer.singleShot(0, lambda: self.list_view.scrollTo(current_index, QAbstractItemView.ScrollHint.EnsureVisible))
 
 
     # resizeEvent remains the same
@@ -789,63 +1452,46 @@ class MainWindow(QMainWindow):
 
     # closeEvent remains the same
     def closeEvent(self, event):
-        if self.pending_changes > 0:
-            self.log_action(f"Application closing with {self.pending_changes} pending changes.")
+        if self._dirty_paths:
+            self.log_action(f"Application closing with {len(self._dirty_paths)} pending changes.")
         else:
              self.log_action("Application closed.")
         self.save_log_file()
-        QPixmapCache.clear()
+        self.log_write_pool.waitForDone() # Don't lose the final log write on exit
         super().closeEvent(event)
 
-    # Refactored keyPressEvent for QListWidget
     def keyPressEvent(self, event):
         """Handles keyboard shortcuts for navigation and actions."""
         key = event.key()
         mods = event.modifiers()
 
-        # Global shortcuts (remain the same)
-        if key == Qt.Key.Key_O and mods == Qt.KeyboardModifier.ControlModifier:
-             self.select_folder(); event.accept(); return
-        elif key in (Qt.Key.Key_Plus, Qt.Key.Key_Equal) or \
-             (key == Qt.Key.Key_Plus and mods == Qt.KeyboardModifier.KeypadModifier):
-             self.set_zoom("in"); event.accept(); return
-        elif key == Qt.Key.Key_Minus or \
-             (key == Qt.Key.Key_Minus and mods == Qt.KeyboardModifier.KeypadModifier):
-              self.set_zoom("out"); event.accept(); return
-        elif key == Qt.Key.Key_S and mods == Qt.KeyboardModifier.ControlModifier:
-             self.apply_changes(); event.accept(); return
+        global_action = self._global_key_actions.get((key, mods))
+        if global_action is not None:
+             global_action(); event.accept(); return
+        zoom_direction = self._zoom_key_actions.get(key)
+        if zoom_direction is not None:
+             self.set_zoom(zoom_direction); event.accept(); return
 
         # Shortcuts requiring selection
-        current_item = self.list_widget.currentItem()
-        if not current_item:
-             super().keyPressEvent(event) # No item selected, pass event up
+        # Navigation is handled by the list view automatically (Up/Down/PageUp/PageDown/Home/End/Space)
+        label_action = self._label_key_actions.get(key)
+        if label_action is None:
+             super().keyPressEvent(event) # Not one of our keys, pass event up
              return
-
-        path = current_item.data(ImagePathRole)
+        current_index = self.list_view.currentIndex()
+        path = current_index.data(ImagePathRole) if current_index.isValid() else None
         if not path:
-             super().keyPressEvent(event) # Item has no path data, pass event up
+             super().keyPressEvent(event) # No row selected, pass event up
              return
 
-        accepted = True
-        # Navigation is handled by QListWidget automatically (Up/Down/Space)
-        # We just need to handle the labeling actions
-        if key == Qt.Key.Key_A or key == Qt.Key.Key_Left: # A or Left -> not_center
-             self.change_selected_label('not_center')
-        elif key == Qt.Key.Key_D or key == Qt.Key.Key_Right: # D or Right -> center
-              self.change_selected_label('center')
-        elif key == Qt.Key.Key_Enter or key == Qt.Key.Key_Return:
-             self.toggle_image_label(path) # Toggle the current item's label
-        else:
-            # Let QListWidget handle default navigation (Up, Down, PageUp, PageDown, Home, End, Space)
-            accepted = False
-            super().keyPressEvent(event)
-
-        if accepted: event.accept()
+        label_action(path)
+        event.accept()
 
 
 if __name__ == '__main__':
     # High DPI scaling is generally handled automatically in Qt6/PySide6
     app = QApplication(sys.argv)
+    app.setApplicationName("image-reviewer") # Names the per-user thumbnail cache directory
     main_win = MainWindow()
     main_win.show()
     sys.exit(app.exec())